@@ -1,20 +1,34 @@
+from ._version import __version__
 from .client import (
     EmergentDB,
+    AsyncEmergentDB,
     EmergentDBError,
+    BatchInsertError,
     InsertResult,
     BatchInsertResult,
     SearchResult,
     SearchResponse,
     DeleteResult,
+    BatchDeleteResult,
+    default_client,
 )
+from ._codec import quantize_int8
+from .buffer import BufferedWriter
+from .cache import EmbedCache
 
 __all__ = [
     "EmergentDB",
+    "AsyncEmergentDB",
     "EmergentDBError",
+    "BatchInsertError",
     "InsertResult",
     "BatchInsertResult",
     "SearchResult",
     "SearchResponse",
     "DeleteResult",
+    "BatchDeleteResult",
+    "BufferedWriter",
+    "EmbedCache",
+    "quantize_int8",
+    "default_client",
 ]
-__version__ = "0.0.11"
@@ -0,0 +1,162 @@
+"""Wire encodings for request/response bodies and embedding vectors."""
+
+from __future__ import annotations
+
+import base64
+import json
+import struct
+import sys
+import zlib
+from array import array
+from typing import Any, Dict, Iterable, Iterator, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional compression
+    zstandard = None
+
+
+def _default(obj: Any) -> Any:
+    # numpy arrays/scalars (and anything array-like) the encoder can't handle natively
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode a request body, using orjson when it is installed.
+
+    numpy arrays are accepted anywhere in the body; orjson serializes
+    contiguous arrays directly from their buffer.
+    """
+    if orjson is not None:
+        # OPT_NON_STR_KEYS: accept int/float/bool keys the way stdlib json does
+        return orjson.dumps(
+            obj, default=_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(
+        obj, default=_default, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    """Decode a response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def iter_json_body(body: Dict[str, Any], stream_key: str) -> Iterator[bytes]:
+    """
+    Encode ``body`` as JSON piece by piece, one item of ``body[stream_key]`` at a time.
+
+    Produces the same document as :func:`json_dumps`, but never holds the
+    whole encoded body in memory alongside the Python objects.
+    """
+    yield b"{" + json_dumps(stream_key) + b":["
+    for i, item in enumerate(body[stream_key]):
+        yield (b"," if i else b"") + json_dumps(item)
+    yield b"]"
+    for key, value in body.items():
+        if key != stream_key:
+            yield b"," + json_dumps(key) + b":" + json_dumps(value)
+    yield b"}"
+
+
+def compressobj(encoding: str) -> Any:
+    """Streaming compressor for a ``Content-Encoding`` of "gzip" or "zstd"."""
+    if encoding == "gzip":
+        return zlib.compressobj(6, zlib.DEFLATED, 31)
+    if encoding == "zstd":
+        if zstandard is None:
+            raise ImportError('compress="zstd" requires the zstandard package: pip install "emergentdb[zstd]"')
+        return zstandard.ZstdCompressor(level=3).compressobj()
+    raise ValueError(f'Unsupported compression {encoding!r}; expected "gzip" or "zstd"')
+
+
+def compress_body(content: Union[bytes, Iterable[bytes]], encoding: str) -> Union[bytes, Iterator[bytes]]:
+    """Compress an encoded request body; a streamed body stays streamed."""
+    c = compressobj(encoding)
+    if isinstance(content, bytes):
+        return c.compress(content) + c.flush()
+    return _compress_chunks(content, c)
+
+
+def _compress_chunks(chunks: Iterable[bytes], c: Any) -> Iterator[bytes]:
+    for chunk in chunks:
+        out = c.compress(chunk)
+        if out:
+            yield out
+    yield c.flush()
+
+
+def f32_bytes(vector: Any) -> bytes:
+    """Pack a vector (list or numpy array) as little-endian float32 bytes."""
+    if hasattr(vector, "astype"):
+        return vector.astype("<f4", copy=False).tobytes()
+    packed = array("f", vector)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def pack_f32(vector: Any) -> str:
+    """Base64 float32 encoding, sent as ``vector_b64`` with ``dtype="f32"``."""
+    return base64.b64encode(f32_bytes(vector)).decode("ascii")
+
+
+# Largest finite float16
+_F16_MAX = 65504.0
+
+
+def pack_f16(vector: Any) -> str:
+    """Base64 half-precision encoding, sent as ``vector_b16`` with ``dtype="f16"``.
+
+    Raises ValueError if a value is outside the float16 range, rather than
+    letting it overflow to inf.
+    """
+    if hasattr(vector, "astype"):
+        peak = float(abs(vector).max()) if vector.size else 0.0
+    else:
+        peak = max((abs(x) for x in vector), default=0.0)
+    if peak > _F16_MAX:
+        raise ValueError(f"Vector value {peak} is outside the float16 range (+/-{_F16_MAX:g})")
+
+    if hasattr(vector, "astype"):
+        data = vector.astype("<f2").tobytes()
+    else:
+        data = struct.pack(f"<{len(vector)}e", *vector)
+    return base64.b64encode(data).decode("ascii")
+
+
+def quantize_int8(vector: Any) -> Tuple[bytes, float]:
+    """
+    Symmetric int8 quantization: ``vector ~= int8_values * scale``.
+
+    Returns:
+        (int8 bytes, scale), with scale = max(|v|) / 127.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None:
+        v = np.asarray(vector, dtype=np.float32)
+        peak = float(np.abs(v).max()) if v.size else 0.0
+        scale = peak / 127 or 1.0
+        return np.rint(v / scale).astype(np.int8).tobytes(), scale
+    peak = max((abs(x) for x in vector), default=0.0)
+    scale = peak / 127 or 1.0
+    return array("b", [round(x / scale) for x in vector]).tobytes(), scale
+
+
+def pack_int8(vector: Any) -> Tuple[str, float]:
+    """Base64 int8 encoding, sent as ``vector_q8_b64`` + ``scale`` with ``dtype="int8"``."""
+    data, scale = quantize_int8(vector)
+    return base64.b64encode(data).decode("ascii"), scale
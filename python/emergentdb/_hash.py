@@ -0,0 +1,37 @@
+"""Digests for client-side cache keys."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+from ._codec import f32_bytes
+
+try:
+    from blake3 import blake3
+except ImportError:  # pragma: no cover - optional speedup
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional speedup
+    xxhash = None
+
+
+def digest(data: bytes) -> bytes:
+    """Hash a byte buffer with the fastest available algorithm."""
+    if blake3 is not None:
+        return blake3(data).digest()
+    if xxhash is not None:
+        return xxhash.xxh3_128_digest(data)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def vec_key(vector: Any) -> bytes:
+    """Key for a vector: one hash over its packed float32 buffer."""
+    return digest(f32_bytes(vector))
+
+
+def text_key(model: str, text: str) -> bytes:
+    """Key for an embedding request: model and text."""
+    return digest(f"{model}\0{text}".encode("utf-8"))
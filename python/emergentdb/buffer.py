@@ -0,0 +1,118 @@
+"""
+Coalescing writer for high-rate single-vector inserts.
+
+Usage:
+    with db.buffered(max_batch=1000, max_delay_ms=10, namespace="docs") as w:
+        for id, vec in stream:
+            w.insert(id, vec)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .client import BatchInsertResult, EmergentDB
+
+
+class BufferedWriter:
+    """
+    Collects ``insert`` calls and sends them as ``batch_insert`` requests.
+
+    A background thread flushes once ``max_batch`` vectors are queued or
+    ``max_delay_ms`` after the first vector of a batch arrived, whichever
+    comes first. Leaving the ``with`` block (or calling :meth:`close`)
+    sends whatever is still queued.
+    """
+
+    def __init__(
+        self,
+        db: "EmergentDB",
+        max_batch: int = 1000,
+        max_delay_ms: float = 10.0,
+        namespace: Optional[str] = None,
+    ):
+        if not 1 <= max_batch <= 1000:
+            raise ValueError("max_batch must be between 1 and 1000")
+
+        self._db = db
+        self._max_batch = max_batch
+        self._max_delay = max_delay_ms / 1000.0
+        self._namespace = namespace
+        self._pending: Deque[Tuple[Dict[str, Any], Future]] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="emergentdb-buffered-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def insert(
+        self,
+        id: int,
+        vector: Any,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> "Future[BatchInsertResult]":
+        """
+        Queue a vector for insertion.
+
+        Returns:
+            Future resolving to the BatchInsertResult of the request that
+            carried this vector (or raising its error).
+        """
+        item: Dict[str, Any] = {"id": id, "vector": vector}
+        if metadata:
+            item["metadata"] = metadata
+
+        future: Future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BufferedWriter is closed")
+            self._pending.append((item, future))
+            if len(self._pending) == 1 or len(self._pending) >= self._max_batch:
+                self._cond.notify()
+        return future
+
+    def close(self) -> None:
+        """Flush queued vectors and stop the background thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+
+                deadline = time.monotonic() + self._max_delay
+                while len(self._pending) < self._max_batch and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                size = min(self._max_batch, len(self._pending))
+                batch = [self._pending.popleft() for _ in range(size)]
+            self._flush(batch)
+
+    def _flush(self, batch: List[Tuple[Dict[str, Any], Future]]) -> None:
+        try:
+            result = self._db.batch_insert([item for item, _ in batch], namespace=self._namespace)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+        else:
+            for _, future in batch:
+                future.set_result(result)
@@ -0,0 +1,146 @@
+"""
+Client-side caches.
+
+Usage:
+    from emergentdb import EmergentDB
+
+    db = EmergentDB("emdb_your_api_key")
+
+    @db.cache_embeddings(model="text-embedding-3-small")
+    def embed(text):
+        return openai_client.embeddings.create(...).data[0].embedding
+
+    embed("hello")  # calls the model
+    embed("hello")  # served from the cache
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+from ._hash import text_key, vec_key
+
+
+class LRUCache:
+    """Thread-safe mapping that evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self._maxsize = maxsize
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class EmbedCache(LRUCache):
+    """
+    LRU cache of embeddings keyed by a hash of (model, text, extra arguments).
+
+    Wrap an embedding function with :meth:`cached` so repeated texts skip
+    the embedding API call entirely.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        super().__init__(maxsize)
+
+    text_key = staticmethod(text_key)
+
+    def cached(self, model: str) -> Callable[[Callable], Callable]:
+        """
+        Decorator for an embedding function.
+
+        The wrapped function may take a single string (returning one
+        embedding) or a list of strings (returning a list of embeddings).
+        For lists, only the texts missing from the cache are passed to the
+        underlying function, in a single call. Any extra arguments (e.g.
+        ``dimensions=256``) are passed through and are part of the cache key.
+        """
+
+        def decorator(fn: Callable) -> Callable:
+            @functools.wraps(fn)
+            def wrapper(texts, *args, **kwargs):
+                # Extra arguments can change the embedding, so they are keyed too
+                variant = f"{model}\0{args!r}\0{sorted(kwargs.items())!r}" if args or kwargs else model
+                if isinstance(texts, str):
+                    key = self.text_key(variant, texts)
+                    embedding = self.get(key)
+                    if embedding is None:
+                        embedding = fn(texts, *args, **kwargs)
+                        self.put(key, embedding)
+                    return embedding
+
+                keys = [self.text_key(variant, t) for t in texts]
+                found = {k: e for k in keys if (e := self.get(k)) is not None}
+                missing = {k: t for k, t in zip(keys, texts) if k not in found}
+                if missing:
+                    embeddings = fn(list(missing.values()), *args, **kwargs)
+                    for k, embedding in zip(missing, embeddings):
+                        self.put(k, embedding)
+                        found[k] = embedding
+                return [found[k] for k in keys]
+
+            wrapper.cache = self
+            return wrapper
+
+        return decorator
+
+
+class SearchCache(LRUCache):
+    """
+    LRU cache of search responses keyed by (query vector, k, include_metadata,
+    namespace, dtype); a quantized query can rank differently, so each wire
+    encoding gets its own entry.
+
+    Entries for a namespace are dropped whenever the client writes to it.
+    """
+
+    @staticmethod
+    def key(
+        vector: Any, k: int, include_metadata: bool, namespace: Optional[str], dtype: Optional[str] = None
+    ) -> Tuple:
+        # namespace stays at index 3; invalidate() matches on it
+        return (vec_key(vector), k, include_metadata, namespace or "default", dtype)
+
+    def invalidate(self, namespace: Optional[str]) -> None:
+        namespace = namespace or "default"
+        with self._lock:
+            for key in [key for key in self._data if key[3] == namespace]:
+                del self._data[key]
@@ -12,6 +12,10 @@ Usage:
     # Search
     results = db.search([0.1, 0.2, ...], k=5)
 
+    # Async
+    async with AsyncEmergentDB("emdb_your_api_key") as db:
+        await db.insert_many([{"id": 1, "vector": [0.1, ...]}, ...])
+
     # Namespaces
     db.insert(1, [0.1, ...], metadata={"title": "Prod"}, namespace="production")
     results = db.search([0.1, ...], namespace="production")
@@ -19,11 +23,60 @@ Usage:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import copy
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Sequence, Union
+from urllib.parse import quote
 
 import httpx
 from dhi import BaseModel, Field
 
+from ._version import __version__
+from ._codec import compress_body, compressobj, iter_json_body, json_dumps, json_loads, pack_f16, pack_f32, pack_int8
+from .buffer import BufferedWriter
+from .cache import EmbedCache, SearchCache
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_API_KEY_PREFIX = "emdb_"
+_BASE_HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": f"emergentdb-python/{__version__}",
+}
+
+# Default connection pools; pass limits=httpx.Limits(...) to size them yourself
+_SYNC_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60.0)
+_ASYNC_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60.0)
+
+# A list of floats or a 1-D numpy array; arrays are serialized without .tolist()
+Vector = Union[Sequence[float], "np.ndarray"]
+
+# Responses worth retrying: rate limited or the gateway/server is overloaded
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_RETRY_BASE_DELAY = 0.5
+_RETRY_MAX_DELAY = 8.0
+_RETRY_AFTER_MAX = 60.0
+
+# Max vectors per batch_insert request
+_BATCH_SIZE = 1000
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Seconds to wait before retry ``attempt`` (0-based): Retry-After, else jittered backoff."""
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), _RETRY_AFTER_MAX)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    backoff = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2**attempt)
+    return backoff + random.uniform(0, _RETRY_BASE_DELAY)
+
 
 class EmergentDBError(Exception):
     """Raised when the EmergentDB API returns an error."""
@@ -34,6 +87,30 @@ class EmergentDBError(Exception):
         self.body = body
 
 
+class BatchInsertError(EmergentDBError):
+    """
+    Raised by ``batch_insert_all`` when a chunk still fails after retries.
+
+    ``completed`` holds the ids/counts inserted before the failure and
+    ``offset`` is the index of the first vector that was not inserted, so
+    the job can resume with ``batch_insert_all(vectors[e.offset:])``.
+    Chunks that were already in flight when the failure hit may also have
+    been written; resuming re-sends them, which upserts.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        status_code: int,
+        body: Any,
+        completed: Dict[str, Any],
+        offset: int,
+    ):
+        super().__init__(message, status_code, body)
+        self.completed = completed
+        self.offset = offset
+
+
 # ── Response Models ────────────────────────────────────────────────
 
 
@@ -59,6 +136,9 @@ class SearchResult(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 
+# Parsed with one SearchResponse.model_validate call: dhi validates the nested
+# results list natively, which measured faster than pre-decoding into
+# msgspec structs and rebuilding these models from them.
 class SearchResponse(BaseModel):
     results: List[SearchResult]
     count: int
@@ -71,6 +151,13 @@ class DeleteResult(BaseModel):
     namespace: str = "default"
 
 
+class BatchDeleteResult(BaseModel):
+    success: bool
+    ids: List[int]
+    count: int
+    namespace: str = "default"
+
+
 # ── Analytics Models ──────────────────────────────────────────────
 
 
@@ -124,28 +211,149 @@ class GrowthEntry(BaseModel):
 # ── Client ─────────────────────────────────────────────────────────
 
 
+def _vector_fields(vector: Any, dtype: Optional[str]) -> Dict[str, Any]:
+    """Body fields for one vector: a JSON float array, packed float32/float16, or int8."""
+    if dtype is None:
+        return {"vector": vector}
+    if dtype == "f32":
+        return {"vector_b64": pack_f32(vector), "dtype": "f32"}
+    if dtype == "f16":
+        return {"vector_b16": pack_f16(vector), "dtype": "f16"}
+    if dtype == "int8":
+        data, scale = pack_int8(vector)
+        return {"vector_q8_b64": data, "scale": scale, "dtype": "int8"}
+    raise ValueError(f'Unsupported dtype {dtype!r}; expected "f32", "f16" or "int8"')
+
+
+def _encode_body(
+    body: Any, stream_key: Optional[str], compress: Optional[str] = None
+) -> Optional[Iterable[bytes]]:
+    """Request content, rebuilt per attempt since a streamed body can't be replayed."""
+    if body is None:
+        return None
+    content = iter_json_body(body, stream_key) if stream_key is not None else json_dumps(body)
+    return compress_body(content, compress) if compress else content
+
+
+def _decode_response(resp: httpx.Response) -> Any:
+    if resp.status_code < 400:
+        return json_loads(resp.content)
+    try:
+        data = json_loads(resp.content)
+    except ValueError:  # e.g. an HTML error page from a proxy
+        data = {"error": resp.text}
+    msg = data.get("error", f"HTTP {resp.status_code}") if isinstance(data, dict) else f"HTTP {resp.status_code}"
+    raise EmergentDBError(msg, resp.status_code, data)
+
+
+async def _aiter_bytes(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+def _chunks(vectors: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    return [vectors[i : i + _BATCH_SIZE] for i in range(0, len(vectors), _BATCH_SIZE)]
+
+
+def _summarize(results: Sequence[Optional[BatchInsertResult]]) -> Dict[str, Any]:
+    """Combine per-chunk results, in chunk order, into the batch_insert_all dict."""
+    all_ids: List[int] = []
+    total_new = 0
+    total_upserted = 0
+    for result in results:
+        if result is None:
+            break
+        all_ids.extend(result.ids)
+        total_new += result.new_count
+        total_upserted += result.upserted_count
+
+    return {
+        "ids": all_ids,
+        "count": len(all_ids),
+        "new_count": total_new,
+        "upserted_count": total_upserted,
+    }
+
+
+def _batch_insert_error(
+    cause: Exception, completed: Sequence[Optional[BatchInsertResult]], offset: int
+) -> BatchInsertError:
+    status_code = getattr(cause, "status_code", 0)
+    body = getattr(cause, "body", None)
+    return BatchInsertError(
+        f"Batch insert failed at vector {offset}: {cause}",
+        status_code,
+        body,
+        _summarize(completed),
+        offset,
+    )
+
+
+def _array_rows(
+    ids: Sequence[int],
+    vectors: "np.ndarray",
+    metadata: Optional[Sequence[Optional[Dict[str, Any]]]],
+) -> List[Dict[str, Any]]:
+    if getattr(vectors, "ndim", None) != 2:
+        raise ValueError("vectors must be a 2-D array of shape (N, D)")
+    if len(ids) != len(vectors) or (metadata is not None and len(metadata) != len(ids)):
+        raise ValueError("ids, vectors and metadata must have the same length")
+    rows = []
+    for i, id in enumerate(ids):
+        row: Dict[str, Any] = {"id": int(id), "vector": vectors[i]}
+        if metadata is not None and metadata[i]:
+            row["metadata"] = metadata[i]
+        rows.append(row)
+    return rows
+
+
+def _encode_vectors(vectors: List[Dict[str, Any]], dtype: Optional[str]) -> List[Dict[str, Any]]:
+    if dtype is None:
+        return vectors
+    encoded = []
+    for v in vectors:
+        item = {key: value for key, value in v.items() if key != "vector"}
+        item.update(_vector_fields(v["vector"], dtype))
+        encoded.append(item)
+    return encoded
+
+
 class EmergentDB:
-    """Client for the EmergentDB vector database API."""
+    """Client for the EmergentDB vector database API.
+
+    A client holds a pooled HTTP/2 connection, so create one and reuse it
+    for many calls rather than constructing a new client per request.
+    """
 
     def __init__(
         self,
         api_key: str,
         base_url: str = "https://api.emergentdb.com",
         timeout: float = 30.0,
+        binary: bool = False,
+        max_retries: int = 3,
+        limits: Optional[httpx.Limits] = None,
+        compress: Optional[str] = None,
     ):
-        if not api_key or not api_key.startswith("emdb_"):
+        if not api_key or not api_key.startswith(_API_KEY_PREFIX):
             raise ValueError('API key must start with "emdb_"')
+        if compress is not None:
+            compressobj(compress)  # fail fast on an unknown encoding or missing zstandard
+        if max_retries < 0:
+            raise ValueError("max_retries must be >= 0")
 
         self._api_key = api_key
         self._base_url = base_url.rstrip("/")
+        self._dtype = "f32" if binary else None
+        self._max_retries = max_retries
+        self._compress = compress
+        self._search_cache: Optional[SearchCache] = None
         self._client = httpx.Client(
             base_url=self._base_url,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-                "User-Agent": "emergentdb-python/0.0.11",
-            },
+            headers={**_BASE_HEADERS, "Authorization": f"Bearer {api_key}"},
             timeout=timeout,
+            http2=True,
+            limits=limits or _SYNC_LIMITS,
         )
 
     def __enter__(self):
@@ -158,48 +366,110 @@ class EmergentDB:
         """Close the HTTP client."""
         self._client.close()
 
-    def _request(self, method: str, path: str, json: Any = None) -> Any:
-        resp = self._client.request(method, path, json=json)
-        data = resp.json()
+    def cache_embeddings(self, model: str, maxsize: int = 10_000) -> Callable[[Callable], Callable]:
+        """
+        Decorator that caches an embedding function's results in memory.
 
-        if resp.status_code >= 400:
-            msg = data.get("error", f"HTTP {resp.status_code}")
-            raise EmergentDBError(msg, resp.status_code, data)
+        Args:
+            model: Embedding model name, part of the cache key.
+            maxsize: Max cached embeddings (LRU eviction, default 10,000).
 
-        return data
+        Returns:
+            Decorator; the wrapped function exposes its EmbedCache as ``.cache``.
+        """
+        return EmbedCache(maxsize).cached(model)
+
+    def buffered(
+        self,
+        max_batch: int = 1000,
+        max_delay_ms: float = 10.0,
+        namespace: Optional[str] = None,
+    ) -> BufferedWriter:
+        """
+        Coalesce single-vector inserts into batch_insert requests.
+
+        Args:
+            max_batch: Flush once this many vectors are queued (1-1000).
+            max_delay_ms: Flush at most this long after a batch's first vector.
+            namespace: Optional namespace for all vectors (default: "default").
+
+        Returns:
+            BufferedWriter; use as a context manager so the tail is flushed.
+        """
+        return BufferedWriter(self, max_batch=max_batch, max_delay_ms=max_delay_ms, namespace=namespace)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        body: Any = None,
+        stream_key: Optional[str] = None,
+    ) -> Any:
+        headers = {"Content-Encoding": self._compress} if self._compress and body is not None else None
+        for attempt in range(self._max_retries + 1):
+            try:
+                resp = self._client.request(
+                    method, path, content=_encode_body(body, stream_key, self._compress), headers=headers
+                )
+            except httpx.TransportError:
+                if attempt == self._max_retries:
+                    raise
+                time.sleep(_retry_delay(attempt))
+                continue
+            if resp.status_code in _RETRY_STATUSES and attempt < self._max_retries:
+                time.sleep(_retry_delay(attempt, resp.headers.get("Retry-After")))
+                continue
+            return _decode_response(resp)
+
+    def _get_search_cache(self, cache: Union[bool, int]) -> SearchCache:
+        if self._search_cache is None:
+            self._search_cache = SearchCache(1024 if cache is True else cache)
+        elif cache is not True:
+            self._search_cache.maxsize = cache
+        return self._search_cache
+
+    def _invalidate(self, namespace: Optional[str]) -> None:
+        if self._search_cache is not None:
+            self._search_cache.invalidate(namespace)
 
     def insert(
         self,
         id: int,
-        vector: List[float],
+        vector: Vector,
         metadata: Optional[Dict[str, Any]] = None,
         namespace: Optional[str] = None,
+        dtype: Optional[str] = None,
     ) -> InsertResult:
         """
         Insert a single vector.
 
         Args:
             id: Positive integer ID (unique per namespace).
-            vector: Embedding array.
+            vector: Embedding (list of floats or 1-D numpy array).
             metadata: Optional metadata dict.
             namespace: Optional namespace (default: "default").
+            dtype: Vector wire encoding: "f32" (packed float32), "f16"
+                (packed float16) or "int8" (quantized). Defaults to the
+                client's setting.
 
         Returns:
             InsertResult with success, id, namespace, upserted.
         """
-        body: Dict[str, Any] = {"id": id, "vector": vector}
+        body: Dict[str, Any] = {"id": id, **_vector_fields(vector, dtype or self._dtype)}
         if metadata:
             body["metadata"] = metadata
         if namespace and namespace != "default":
             body["namespace"] = namespace
 
-        data = self._request("POST", "/vectors/insert", json=body)
+        data = self._request("POST", "/vectors/insert", body)
+        self._invalidate(namespace)
         return InsertResult.model_validate(data)
 
     def batch_insert(
         self,
         vectors: List[Dict[str, Any]],
         namespace: Optional[str] = None,
+        dtype: Optional[str] = None,
     ) -> BatchInsertResult:
         """
         Batch insert up to 1000 vectors.
@@ -207,83 +477,155 @@ class EmergentDB:
         Args:
             vectors: List of dicts with keys: id (int), vector (list), metadata (optional dict).
             namespace: Optional namespace for all vectors (default: "default").
+            dtype: Vector wire encoding: "f32" (packed float32), "f16"
+                (packed float16) or "int8" (quantized). Defaults to the
+                client's setting.
 
         Returns:
             BatchInsertResult with ids, count, new_count, upserted_count.
         """
-        if len(vectors) > 1000:
+        if len(vectors) > _BATCH_SIZE:
             raise ValueError("Batch insert supports max 1000 vectors per request")
 
-        body: Dict[str, Any] = {"vectors": vectors}
+        body: Dict[str, Any] = {"vectors": _encode_vectors(vectors, dtype or self._dtype)}
         if namespace and namespace != "default":
             body["namespace"] = namespace
 
-        data = self._request("POST", "/vectors/batch_insert", json=body)
+        # Stream the (potentially tens of MB) body vector by vector
+        data = self._request("POST", "/vectors/batch_insert", body, stream_key="vectors")
+        self._invalidate(namespace)
         return BatchInsertResult.model_validate(data)
 
     def batch_insert_all(
         self,
         vectors: List[Dict[str, Any]],
         namespace: Optional[str] = None,
+        max_in_flight: int = 4,
+        dtype: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Batch insert any number of vectors (auto-chunks into 1000-vector batches).
 
+        Up to ``max_in_flight`` chunks are sent concurrently over the shared
+        connection pool, which hides per-chunk server commit latency. The
+        server must accept concurrent writes to the namespace; pass
+        ``max_in_flight=1`` to send chunks strictly one after another.
+
         Args:
             vectors: List of dicts with keys: id (int), vector (list), metadata (optional dict).
             namespace: Optional namespace for all vectors (default: "default").
+            max_in_flight: Max chunks in flight at once (default 4).
+            dtype: Vector wire encoding, as for :meth:`batch_insert`.
+
+        Returns:
+            Dict with ids (in input order), count, new_count, upserted_count.
+
+        Raises:
+            BatchInsertError: A chunk failed after retries; see ``offset``.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+
+        chunks = _chunks(vectors)
+        results: List[Optional[BatchInsertResult]] = [None] * len(chunks)
+        failure: Optional[tuple] = None
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_in_flight, len(chunks)))) as pool:
+            futures = {pool.submit(self.batch_insert, chunk, namespace, dtype): n for n, chunk in enumerate(chunks)}
+            try:
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
+                    n = futures[future]
+                    try:
+                        results[n] = future.result()
+                    except (EmergentDBError, httpx.TransportError) as e:
+                        if failure is None or n < failure[0]:
+                            failure = (n, e)
+                        for pending in futures:
+                            pending.cancel()
+            finally:
+                # Any other exception leaves the loop too; don't send the chunks still queued
+                for pending in futures:
+                    pending.cancel()
+
+        if failure is not None:
+            n, cause = failure
+            raise _batch_insert_error(cause, results[:n], n * _BATCH_SIZE) from cause
+        return _summarize(results)
+
+    def batch_insert_array(
+        self,
+        ids: Sequence[int],
+        vectors: "np.ndarray",
+        metadata: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+        namespace: Optional[str] = None,
+        dtype: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Batch insert rows of a 2-D array (auto-chunks into 1000-vector batches).
+
+        Rows are serialized straight from the array buffer, so there is no
+        need to call ``.tolist()`` first.
+
+        Args:
+            ids: One integer ID per row.
+            vectors: Array of shape (N, D).
+            metadata: Optional list of N metadata dicts (or None entries).
+            namespace: Optional namespace for all vectors (default: "default").
+            dtype: Vector wire encoding, as for :meth:`batch_insert`.
 
         Returns:
             Dict with ids, count, new_count, upserted_count.
         """
-        batch_size = 1000
-        all_ids: List[int] = []
-        total_new = 0
-        total_upserted = 0
-
-        for i in range(0, len(vectors), batch_size):
-            chunk = vectors[i : i + batch_size]
-            result = self.batch_insert(chunk, namespace=namespace)
-            all_ids.extend(result.ids)
-            total_new += result.new_count
-            total_upserted += result.upserted_count
-
-        return {
-            "ids": all_ids,
-            "count": len(all_ids),
-            "new_count": total_new,
-            "upserted_count": total_upserted,
-        }
+        return self.batch_insert_all(_array_rows(ids, vectors, metadata), namespace=namespace, dtype=dtype)
 
     def search(
         self,
-        vector: List[float],
+        vector: Vector,
         k: int = 10,
         include_metadata: bool = False,
         namespace: Optional[str] = None,
+        cache: Union[bool, int] = False,
+        dtype: Optional[str] = None,
     ) -> SearchResponse:
         """
         Search for similar vectors.
 
         Args:
-            vector: Query embedding.
+            vector: Query embedding (list of floats or 1-D numpy array).
             k: Number of results (1-100, default 10).
             include_metadata: Include metadata in results.
             namespace: Optional namespace to search within (default: "default").
+            cache: Serve repeated identical queries from a client-side LRU
+                cache. True uses 1024 entries; an int sets the capacity.
+                Writes through this client invalidate the namespace's entries.
+            dtype: Query vector wire encoding, as for :meth:`insert`.
 
         Returns:
             SearchResponse with results list and count.
         """
+        if cache:
+            search_cache = self._get_search_cache(cache)
+            key = search_cache.key(vector, k, include_metadata, namespace, dtype or self._dtype)
+            hit = search_cache.get(key)
+            if hit is not None:
+                # Copies in and out, so a caller mutating its response can't corrupt the cache
+                return copy.deepcopy(hit)
+
         body: Dict[str, Any] = {
-            "vector": vector,
+            **_vector_fields(vector, dtype or self._dtype),
             "k": k,
             "include_metadata": include_metadata,
         }
         if namespace and namespace != "default":
             body["namespace"] = namespace
 
-        data = self._request("POST", "/vectors/search", json=body)
-        return SearchResponse.model_validate(data)
+        data = self._request("POST", "/vectors/search", body)
+        result = SearchResponse.model_validate(data)
+        if cache:
+            search_cache.put(key, copy.deepcopy(result))
+        return result
 
     def delete(self, id: int, namespace: Optional[str] = None) -> DeleteResult:
         """
@@ -300,9 +642,36 @@ class EmergentDB:
         if namespace and namespace != "default":
             body["namespace"] = namespace
 
-        data = self._request("POST", "/vectors/delete", json=body)
+        data = self._request("POST", "/vectors/delete", body)
+        self._invalidate(namespace)
         return DeleteResult.model_validate(data)
 
+    def batch_delete(
+        self,
+        ids: List[int],
+        namespace: Optional[str] = None,
+    ) -> BatchDeleteResult:
+        """
+        Delete up to 1000 vectors by ID in one request.
+
+        Args:
+            ids: Vector IDs to delete.
+            namespace: Optional namespace (default: "default").
+
+        Returns:
+            BatchDeleteResult with the deleted ids and count.
+        """
+        if len(ids) > 1000:
+            raise ValueError("Batch delete supports max 1000 ids per request")
+
+        body: Dict[str, Any] = {"ids": list(ids)}
+        if namespace and namespace != "default":
+            body["namespace"] = namespace
+
+        data = self._request("POST", "/vectors/batch_delete", body)
+        self._invalidate(namespace)
+        return BatchDeleteResult.model_validate(data)
+
     def list_namespaces(self) -> List[str]:
         """
         List all namespaces for the authenticated tenant.
@@ -313,34 +682,470 @@ class EmergentDB:
         data = self._request("GET", "/vectors/namespaces")
         return data.get("namespaces", [])
 
+    def count(self, namespace: Optional[str] = None) -> int:
+        """
+        Number of vectors in a namespace.
+
+        Cheaper than a search when only the size matters (e.g. checking a
+        namespace is empty): no query vector is sent and nothing is ranked.
+
+        Args:
+            namespace: Optional namespace (default: "default").
+
+        Returns:
+            Vector count.
+        """
+        data = self._request("GET", f"/vectors/namespaces/{quote(namespace or 'default', safe='')}/count")
+        return data["count"]
+
     # ── Analytics Methods ─────────────────────────────────────────
+    # raw=True returns the rows as plain dicts, skipping per-row model
+    # validation (useful for dashboards that refresh frequently).
 
-    def analytics_endpoints(self) -> List[EndpointStats]:
+    def analytics_endpoints(self, raw: bool = False) -> Union[List[EndpointStats], List[Dict[str, Any]]]:
         """Get request breakdown by endpoint (last 30 days)."""
         data = self._request("GET", "/api/dashboard/analytics/endpoints")
-        return [EndpointStats.model_validate(e) for e in data.get("endpoints", [])]
+        rows = data.get("endpoints", [])
+        return rows if raw else [EndpointStats.model_validate(e) for e in rows]
 
-    def analytics_namespaces(self) -> List[NamespaceStats]:
+    def analytics_namespaces(self, raw: bool = False) -> Union[List[NamespaceStats], List[Dict[str, Any]]]:
         """Get usage breakdown by namespace (last 30 days)."""
         data = self._request("GET", "/api/dashboard/analytics/namespaces")
-        return [NamespaceStats.model_validate(n) for n in data.get("namespaces", [])]
+        rows = data.get("namespaces", [])
+        return rows if raw else [NamespaceStats.model_validate(n) for n in rows]
 
-    def analytics_latency(self) -> List[LatencyEntry]:
+    def analytics_latency(self, raw: bool = False) -> Union[List[LatencyEntry], List[Dict[str, Any]]]:
         """Get latency percentiles by day (last 30 days)."""
         data = self._request("GET", "/api/dashboard/analytics/latency")
-        return [LatencyEntry.model_validate(l) for l in data.get("latency", [])]
+        rows = data.get("latency", [])
+        return rows if raw else [LatencyEntry.model_validate(l) for l in rows]
 
-    def analytics_errors(self) -> List[ErrorEntry]:
+    def analytics_errors(self, raw: bool = False) -> Union[List[ErrorEntry], List[Dict[str, Any]]]:
         """Get error rate breakdown by day (last 30 days)."""
         data = self._request("GET", "/api/dashboard/analytics/errors")
-        return [ErrorEntry.model_validate(e) for e in data.get("errors", [])]
+        rows = data.get("errors", [])
+        return rows if raw else [ErrorEntry.model_validate(e) for e in rows]
 
-    def analytics_keys(self) -> List[KeyStats]:
+    def analytics_keys(self, raw: bool = False) -> Union[List[KeyStats], List[Dict[str, Any]]]:
         """Get per-API-key usage stats (last 30 days)."""
         data = self._request("GET", "/api/dashboard/analytics/keys")
-        return [KeyStats.model_validate(k) for k in data.get("keys", [])]
+        rows = data.get("keys", [])
+        return rows if raw else [KeyStats.model_validate(k) for k in rows]
 
-    def analytics_growth(self) -> List[GrowthEntry]:
+    def analytics_growth(self, raw: bool = False) -> Union[List[GrowthEntry], List[Dict[str, Any]]]:
         """Get vector count growth over time (daily snapshots, last 90 days)."""
         data = self._request("GET", "/api/dashboard/analytics/growth")
-        return [GrowthEntry.model_validate(g) for g in data.get("growth", [])]
+        rows = data.get("growth", [])
+        return rows if raw else [GrowthEntry.model_validate(g) for g in rows]
+
+    def analytics_all(self, raw: bool = False) -> Dict[str, List[Any]]:
+        """
+        Fetch all analytics breakdowns concurrently.
+
+        Args:
+            raw: Return rows as plain dicts instead of validated models.
+
+        Returns:
+            Dict with keys endpoints, namespaces, latency, errors, keys, growth.
+        """
+        fetchers = {
+            "endpoints": self.analytics_endpoints,
+            "namespaces": self.analytics_namespaces,
+            "latency": self.analytics_latency,
+            "errors": self.analytics_errors,
+            "keys": self.analytics_keys,
+            "growth": self.analytics_growth,
+        }
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as pool:
+            futures = {name: pool.submit(fn, raw) for name, fn in fetchers.items()}
+            return {name: future.result() for name, future in futures.items()}
+
+
+_default_client: Optional[EmergentDB] = None
+_default_client_lock = threading.Lock()
+
+
+def default_client() -> EmergentDB:
+    """
+    Shared client configured from the environment.
+
+    Reads the API key from ``EMERGENTDB_API_KEY`` (or ``EMERGENTDB_KEY``) on
+    first use and returns the same pooled client on every call, so scripts
+    and tests can reuse one set of connections.
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            api_key = os.environ.get("EMERGENTDB_API_KEY") or os.environ.get("EMERGENTDB_KEY")
+            if not api_key:
+                raise ValueError("Set EMERGENTDB_API_KEY to use default_client()")
+            _default_client = EmergentDB(api_key)
+        return _default_client
+
+
+class AsyncEmergentDB:
+    """Async client for the EmergentDB vector database API.
+
+    Mirrors :class:`EmergentDB` but every method is a coroutine, so many
+    requests can be in flight at once (e.g. with ``asyncio.gather``).
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.emergentdb.com",
+        timeout: float = 30.0,
+        binary: bool = False,
+        max_retries: int = 3,
+        limits: Optional[httpx.Limits] = None,
+        compress: Optional[str] = None,
+    ):
+        if not api_key or not api_key.startswith(_API_KEY_PREFIX):
+            raise ValueError('API key must start with "emdb_"')
+        if compress is not None:
+            compressobj(compress)  # fail fast on an unknown encoding or missing zstandard
+        if max_retries < 0:
+            raise ValueError("max_retries must be >= 0")
+
+        self._api_key = api_key
+        self._base_url = base_url.rstrip("/")
+        self._dtype = "f32" if binary else None
+        self._max_retries = max_retries
+        self._compress = compress
+        self._search_cache: Optional[SearchCache] = None
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            headers={**_BASE_HEADERS, "Authorization": f"Bearer {api_key}"},
+            timeout=timeout,
+            http2=True,
+            limits=limits or _ASYNC_LIMITS,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        body: Any = None,
+        stream_key: Optional[str] = None,
+    ) -> Any:
+        headers = {"Content-Encoding": self._compress} if self._compress and body is not None else None
+        for attempt in range(self._max_retries + 1):
+            content = _encode_body(body, stream_key, self._compress)
+            if stream_key is not None:
+                content = _aiter_bytes(content)
+            try:
+                resp = await self._client.request(method, path, content=content, headers=headers)
+            except httpx.TransportError:
+                if attempt == self._max_retries:
+                    raise
+                await asyncio.sleep(_retry_delay(attempt))
+                continue
+            if resp.status_code in _RETRY_STATUSES and attempt < self._max_retries:
+                await asyncio.sleep(_retry_delay(attempt, resp.headers.get("Retry-After")))
+                continue
+            return _decode_response(resp)
+
+    def _get_search_cache(self, cache: Union[bool, int]) -> SearchCache:
+        if self._search_cache is None:
+            self._search_cache = SearchCache(1024 if cache is True else cache)
+        elif cache is not True:
+            self._search_cache.maxsize = cache
+        return self._search_cache
+
+    def _invalidate(self, namespace: Optional[str]) -> None:
+        if self._search_cache is not None:
+            self._search_cache.invalidate(namespace)
+
+    async def insert(
+        self,
+        id: int,
+        vector: Vector,
+        metadata: Optional[Dict[str, Any]] = None,
+        namespace: Optional[str] = None,
+        dtype: Optional[str] = None,
+    ) -> InsertResult:
+        """Insert a single vector. See :meth:`EmergentDB.insert`."""
+        body: Dict[str, Any] = {"id": id, **_vector_fields(vector, dtype or self._dtype)}
+        if metadata:
+            body["metadata"] = metadata
+        if namespace and namespace != "default":
+            body["namespace"] = namespace
+
+        data = await self._request("POST", "/vectors/insert", body)
+        self._invalidate(namespace)
+        return InsertResult.model_validate(data)
+
+    async def insert_many(
+        self,
+        vectors: List[Dict[str, Any]],
+        namespace: Optional[str] = None,
+        concurrency: int = 32,
+    ) -> List[InsertResult]:
+        """
+        Insert vectors one request each, with up to ``concurrency`` in flight.
+
+        Prefer :meth:`batch_insert_all` when the vectors are known up front;
+        this is for callers that want per-vector results.
+
+        Args:
+            vectors: List of dicts with keys: id (int), vector (list), metadata (optional dict).
+            namespace: Optional namespace for all vectors (default: "default").
+            concurrency: Max concurrent insert requests (default 32).
+
+        Returns:
+            List of InsertResult, in the same order as ``vectors``.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _insert(v: Dict[str, Any]) -> InsertResult:
+            async with semaphore:
+                return await self.insert(
+                    v["id"], v["vector"], metadata=v.get("metadata"), namespace=namespace
+                )
+
+        return list(await asyncio.gather(*[_insert(v) for v in vectors]))
+
+    async def batch_insert(
+        self,
+        vectors: List[Dict[str, Any]],
+        namespace: Optional[str] = None,
+        dtype: Optional[str] = None,
+    ) -> BatchInsertResult:
+        """Batch insert up to 1000 vectors. See :meth:`EmergentDB.batch_insert`."""
+        if len(vectors) > _BATCH_SIZE:
+            raise ValueError("Batch insert supports max 1000 vectors per request")
+
+        body: Dict[str, Any] = {"vectors": _encode_vectors(vectors, dtype or self._dtype)}
+        if namespace and namespace != "default":
+            body["namespace"] = namespace
+
+        data = await self._request("POST", "/vectors/batch_insert", body, stream_key="vectors")
+        self._invalidate(namespace)
+        return BatchInsertResult.model_validate(data)
+
+    async def batch_insert_all(
+        self,
+        vectors: List[Dict[str, Any]],
+        namespace: Optional[str] = None,
+        max_in_flight: int = 4,
+        dtype: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Batch insert any number of vectors. See :meth:`EmergentDB.batch_insert_all`."""
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+
+        semaphore = asyncio.Semaphore(max_in_flight)
+
+        async def _insert(chunk: List[Dict[str, Any]]) -> BatchInsertResult:
+            async with semaphore:
+                return await self.batch_insert(chunk, namespace=namespace, dtype=dtype)
+
+        tasks = [asyncio.ensure_future(_insert(chunk)) for chunk in _chunks(vectors)]
+        results: List[BatchInsertResult] = []
+        try:
+            # Walk chunks in input order; the first failure cancels the chunks not yet sent
+            for n, task in enumerate(tasks):
+                try:
+                    results.append(await task)
+                except (EmergentDBError, httpx.TransportError) as e:
+                    raise _batch_insert_error(e, results, n * _BATCH_SIZE) from e
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return _summarize(results)
+
+    async def batch_insert_stream(
+        self,
+        vectors: List[Dict[str, Any]],
+        namespace: Optional[str] = None,
+        batch_size: int = 100,
+        max_in_flight: int = 4,
+        dtype: Optional[str] = None,
+    ) -> AsyncIterator[BatchInsertResult]:
+        """
+        Insert vectors in batches, yielding each batch's result as soon as it lands.
+
+        Where :meth:`batch_insert_all` returns once every chunk is done, this
+        lets the caller act on early batches while later ones are still
+        uploading. Results arrive in completion order; match them to the
+        input by their ``ids``. A failed batch raises when it is reached and
+        cancels the batches still in flight.
+
+        Args:
+            vectors: List of dicts with keys: id (int), vector (list), metadata (optional dict).
+            namespace: Optional namespace for all vectors (default: "default").
+            batch_size: Vectors per request (1-1000).
+            max_in_flight: Max requests sent at once.
+            dtype: Vector wire encoding, as for :meth:`EmergentDB.batch_insert`.
+        """
+        if not 1 <= batch_size <= _BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {_BATCH_SIZE}")
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+
+        semaphore = asyncio.Semaphore(max_in_flight)
+
+        async def _insert(chunk: List[Dict[str, Any]]) -> BatchInsertResult:
+            async with semaphore:
+                return await self.batch_insert(chunk, namespace=namespace, dtype=dtype)
+
+        tasks = [
+            asyncio.ensure_future(_insert(vectors[i : i + batch_size]))
+            for i in range(0, len(vectors), batch_size)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def batch_insert_array(
+        self,
+        ids: Sequence[int],
+        vectors: "np.ndarray",
+        metadata: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+        namespace: Optional[str] = None,
+        dtype: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Batch insert rows of a 2-D array. See :meth:`EmergentDB.batch_insert_array`."""
+        return await self.batch_insert_all(
+            _array_rows(ids, vectors, metadata), namespace=namespace, dtype=dtype
+        )
+
+    async def search(
+        self,
+        vector: Vector,
+        k: int = 10,
+        include_metadata: bool = False,
+        namespace: Optional[str] = None,
+        cache: Union[bool, int] = False,
+        dtype: Optional[str] = None,
+    ) -> SearchResponse:
+        """Search for similar vectors. See :meth:`EmergentDB.search`."""
+        if cache:
+            search_cache = self._get_search_cache(cache)
+            key = search_cache.key(vector, k, include_metadata, namespace, dtype or self._dtype)
+            hit = search_cache.get(key)
+            if hit is not None:
+                # Copies in and out, so a caller mutating its response can't corrupt the cache
+                return copy.deepcopy(hit)
+
+        body: Dict[str, Any] = {
+            **_vector_fields(vector, dtype or self._dtype),
+            "k": k,
+            "include_metadata": include_metadata,
+        }
+        if namespace and namespace != "default":
+            body["namespace"] = namespace
+
+        data = await self._request("POST", "/vectors/search", body)
+        result = SearchResponse.model_validate(data)
+        if cache:
+            search_cache.put(key, copy.deepcopy(result))
+        return result
+
+    async def delete(self, id: int, namespace: Optional[str] = None) -> DeleteResult:
+        """Delete a vector by ID. See :meth:`EmergentDB.delete`."""
+        body: Dict[str, Any] = {"id": id}
+        if namespace and namespace != "default":
+            body["namespace"] = namespace
+
+        data = await self._request("POST", "/vectors/delete", body)
+        self._invalidate(namespace)
+        return DeleteResult.model_validate(data)
+
+    async def batch_delete(
+        self,
+        ids: List[int],
+        namespace: Optional[str] = None,
+    ) -> BatchDeleteResult:
+        """Delete up to 1000 vectors by ID. See :meth:`EmergentDB.batch_delete`."""
+        if len(ids) > 1000:
+            raise ValueError("Batch delete supports max 1000 ids per request")
+
+        body: Dict[str, Any] = {"ids": list(ids)}
+        if namespace and namespace != "default":
+            body["namespace"] = namespace
+
+        data = await self._request("POST", "/vectors/batch_delete", body)
+        self._invalidate(namespace)
+        return BatchDeleteResult.model_validate(data)
+
+    async def list_namespaces(self) -> List[str]:
+        """List all namespaces for the authenticated tenant."""
+        data = await self._request("GET", "/vectors/namespaces")
+        return data.get("namespaces", [])
+
+    async def count(self, namespace: Optional[str] = None) -> int:
+        """Number of vectors in a namespace. See :meth:`EmergentDB.count`."""
+        data = await self._request("GET", f"/vectors/namespaces/{quote(namespace or 'default', safe='')}/count")
+        return data["count"]
+
+    # ── Analytics Methods ─────────────────────────────────────────
+    # raw=True returns the rows as plain dicts, skipping per-row model
+    # validation (useful for dashboards that refresh frequently).
+
+    async def analytics_endpoints(self, raw: bool = False) -> Union[List[EndpointStats], List[Dict[str, Any]]]:
+        """Get request breakdown by endpoint (last 30 days)."""
+        data = await self._request("GET", "/api/dashboard/analytics/endpoints")
+        rows = data.get("endpoints", [])
+        return rows if raw else [EndpointStats.model_validate(e) for e in rows]
+
+    async def analytics_namespaces(self, raw: bool = False) -> Union[List[NamespaceStats], List[Dict[str, Any]]]:
+        """Get usage breakdown by namespace (last 30 days)."""
+        data = await self._request("GET", "/api/dashboard/analytics/namespaces")
+        rows = data.get("namespaces", [])
+        return rows if raw else [NamespaceStats.model_validate(n) for n in rows]
+
+    async def analytics_latency(self, raw: bool = False) -> Union[List[LatencyEntry], List[Dict[str, Any]]]:
+        """Get latency percentiles by day (last 30 days)."""
+        data = await self._request("GET", "/api/dashboard/analytics/latency")
+        rows = data.get("latency", [])
+        return rows if raw else [LatencyEntry.model_validate(l) for l in rows]
+
+    async def analytics_errors(self, raw: bool = False) -> Union[List[ErrorEntry], List[Dict[str, Any]]]:
+        """Get error rate breakdown by day (last 30 days)."""
+        data = await self._request("GET", "/api/dashboard/analytics/errors")
+        rows = data.get("errors", [])
+        return rows if raw else [ErrorEntry.model_validate(e) for e in rows]
+
+    async def analytics_keys(self, raw: bool = False) -> Union[List[KeyStats], List[Dict[str, Any]]]:
+        """Get per-API-key usage stats (last 30 days)."""
+        data = await self._request("GET", "/api/dashboard/analytics/keys")
+        rows = data.get("keys", [])
+        return rows if raw else [KeyStats.model_validate(k) for k in rows]
+
+    async def analytics_growth(self, raw: bool = False) -> Union[List[GrowthEntry], List[Dict[str, Any]]]:
+        """Get vector count growth over time (daily snapshots, last 90 days)."""
+        data = await self._request("GET", "/api/dashboard/analytics/growth")
+        rows = data.get("growth", [])
+        return rows if raw else [GrowthEntry.model_validate(g) for g in rows]
+
+    async def analytics_all(self, raw: bool = False) -> Dict[str, List[Any]]:
+        """Fetch all analytics breakdowns concurrently. See :meth:`EmergentDB.analytics_all`."""
+        names = ["endpoints", "namespaces", "latency", "errors", "keys", "growth"]
+        results = await asyncio.gather(
+            self.analytics_endpoints(raw),
+            self.analytics_namespaces(raw),
+            self.analytics_latency(raw),
+            self.analytics_errors(raw),
+            self.analytics_keys(raw),
+            self.analytics_growth(raw),
+        )
+        return dict(zip(names, results))
@@ -15,7 +15,7 @@ Gemini also supports task types for optimized embeddings:
   - CLASSIFICATION, CLUSTERING, etc.
 
 Requirements:
-    pip install google-genai emergentdb
+    pip install google-genai emergentdb numpy
 
 Environment variables:
     GEMINI_API_KEY   - Your Gemini API key
@@ -24,9 +24,11 @@ Environment variables:
 Usage:
     python gemini_embeddings.py
 """
+import itertools
 import os
 import sys
 
+import numpy as np
 from google import genai
 from google.genai import types
 
@@ -53,12 +55,16 @@ DIM = 1536  # Matches Bolt's configured dimensionality
 # ── Helper: normalize + generate embeddings with Gemini ───────────
 def normalize(vec: list[float]) -> list[float]:
     """L2-normalize a vector. Required for Gemini embeddings at non-3072 dims."""
-    norm = sum(v * v for v in vec) ** 0.5
-    return [v / norm for v in vec] if norm > 0 else vec
+    a = np.asarray(vec, dtype=np.float32)
+    norm = np.linalg.norm(a)
+    return (a / norm).tolist() if norm > 0 else vec
 
 
-def embed_documents(texts: list[str]) -> list[list[float]]:
-    """Embed documents using RETRIEVAL_DOCUMENT task type at 1536-dim."""
+def embed_documents(texts: list[str]) -> np.ndarray:
+    """Embed documents using RETRIEVAL_DOCUMENT task type at 1536-dim.
+
+    Returns an (N, 1536) float32 array of unit-length rows.
+    """
     result = gemini_client.models.embed_content(
         model="gemini-embedding-001",
         contents=texts,
@@ -68,8 +74,10 @@ def embed_documents(texts: list[str]) -> list[list[float]]:
         ),
     )
     # Gemini 1536-dim embeddings are NOT pre-normalized (only 3072 are).
-    # Normalize so inner_product == cosine similarity.
-    return [normalize(e.values) for e in result.embeddings]
+    # Normalize so inner_product == cosine similarity. All rows at once.
+    m = np.asarray([e.values for e in result.embeddings], dtype=np.float32)
+    m /= np.maximum(np.linalg.norm(m, axis=1, keepdims=True), 1e-12)
+    return m
 
 
 def embed_query(text: str) -> list[float]:
@@ -104,11 +112,16 @@ print("1. Generating embeddings for documents...")
 print("   Using task_type=RETRIEVAL_DOCUMENT, output_dimensionality=1536")
 texts = [doc["text"] for doc in documents]
 embeddings = embed_documents(texts)
-print(f"   Generated {len(embeddings)} embeddings, each {len(embeddings[0])}-dim")
+print(f"   Generated {embeddings.shape[0]} embeddings, each {embeddings.shape[1]}-dim")
 
 print("2. Inserting vectors into EmergentDB...")
-for doc, emb in zip(documents, embeddings):
-    db.insert(doc["id"], emb, metadata={"title": doc["title"], "text": doc["text"]}, namespace=NAMESPACE)
+# The float32 matrix goes straight to the SDK -- no .tolist() per row
+db.batch_insert_array(
+    [doc["id"] for doc in documents],
+    embeddings,
+    metadata=[{"title": doc["title"], "text": doc["text"]} for doc in documents],
+    namespace=NAMESPACE,
+)
 print(f"   Inserted {len(documents)} vectors into '{NAMESPACE}' namespace")
 
 # ── Step 2: Semantic search ───────────────────────────────────────
@@ -148,20 +161,15 @@ sim_result = gemini_client.models.embed_content(
         output_dimensionality=DIM,
     ),
 )
-sim_embeddings = [e.values for e in sim_result.embeddings]
-
-# Compute cosine similarity
-def cosine_sim(a, b):
-    dot = sum(x * y for x, y in zip(a, b))
-    mag_a = sum(x * x for x in a) ** 0.5
-    mag_b = sum(x * x for x in b) ** 0.5
-    return dot / (mag_a * mag_b) if mag_a and mag_b else 0.0
-
-for i in range(len(similarity_texts)):
-    for j in range(i + 1, len(similarity_texts)):
-        sim = cosine_sim(sim_embeddings[i], sim_embeddings[j])
-        print(f'   "{similarity_texts[i]}" <-> "{similarity_texts[j]}"')
-        print(f"     Cosine similarity: {sim:.4f}\n")
+sim_embeddings = np.asarray([e.values for e in sim_result.embeddings], dtype=np.float32)
+
+# Cosine similarity of every pair: normalize rows, then one matrix product
+sim_embeddings /= np.maximum(np.linalg.norm(sim_embeddings, axis=1, keepdims=True), 1e-12)
+sim_matrix = sim_embeddings @ sim_embeddings.T
+
+for i, j in itertools.combinations(range(len(similarity_texts)), 2):
+    print(f'   "{similarity_texts[i]}" <-> "{similarity_texts[j]}"')
+    print(f"     Cosine similarity: {sim_matrix[i, j]:.4f}\n")
 
 # ── Step 4: Cleanup ──────────────────────────────────────────────
 print("5. Cleaning up...")
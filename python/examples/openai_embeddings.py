@@ -39,6 +39,7 @@ db = EmergentDB(EMERGENTDB_KEY)
 NAMESPACE = "openai-example"
 
 # ── Helper: generate embedding with OpenAI ────────────────────────
+@db.cache_embeddings(model="text-embedding-3-small")
 def embed(text: str) -> list[float]:
     """Generate a 1536-dim embedding using text-embedding-3-small."""
     response = openai_client.embeddings.create(
@@ -78,8 +79,13 @@ embeddings = embed_batch(texts)
 print(f"   Generated {len(embeddings)} embeddings, each {len(embeddings[0])}-dim")
 
 print("2. Inserting vectors into EmergentDB...")
-for doc, emb in zip(documents, embeddings):
-    db.insert(doc["id"], emb, metadata={"title": doc["title"], "text": doc["text"]}, namespace=NAMESPACE)
+db.batch_insert_all(
+    [
+        {"id": doc["id"], "vector": emb, "metadata": {"title": doc["title"], "text": doc["text"]}}
+        for doc, emb in zip(documents, embeddings)
+    ],
+    namespace=NAMESPACE,
+)
 print(f"   Inserted {len(documents)} vectors into '{NAMESPACE}' namespace")
 
 # ── Step 2: Semantic search ───────────────────────────────────────
@@ -0,0 +1,750 @@
+"""
+Test: client request/response handling without hitting the network.
+
+Uses httpx.MockTransport to stand in for the EmergentDB API so the
+sync and async clients can be exercised offline:
+1. Request bodies and paths match the API
+2. Responses are parsed into the SDK models
+3. Errors surface as EmergentDBError
+"""
+
+import asyncio
+import base64
+import gzip
+import json
+import os
+import struct
+import sys
+
+import httpx
+
+sys.path.insert(0, ".")
+import emergentdb.client
+from emergentdb import (
+    EmergentDB,
+    AsyncEmergentDB,
+    EmergentDBError,
+    BatchInsertError,
+    EmbedCache,
+    InsertResult,
+    quantize_int8,
+)
+
+
+# (name, fn) in run order. pytest collects the test_* functions directly;
+# `python <this file>` runs them through main() below.
+TESTS = []
+
+
+def test(name, fn):
+    TESTS.append((name, fn))
+
+
+# ── Fake API ──
+def fake_api(requests):
+    """Build a handler that records requests and answers like the API."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content) if request.content else None
+        requests.append((request.method, request.url.path, body))
+        ns = (body or {}).get("namespace", "default")
+        path = request.url.path
+
+        if path == "/vectors/insert":
+            return httpx.Response(200, json={"success": True, "id": body["id"], "namespace": ns})
+        if path == "/vectors/batch_insert":
+            ids = [v["id"] for v in body["vectors"]]
+            return httpx.Response(
+                200,
+                json={"success": True, "ids": ids, "count": len(ids), "namespace": ns, "new_count": len(ids)},
+            )
+        if path == "/vectors/search":
+            return httpx.Response(
+                200,
+                json={"results": [{"id": 1, "score": 0.1}], "count": 1, "namespace": ns},
+            )
+        if path == "/vectors/delete":
+            return httpx.Response(200, json={"deleted": True, "id": body["id"], "namespace": ns})
+        if path == "/vectors/batch_delete":
+            return httpx.Response(
+                200,
+                json={"success": True, "ids": body["ids"], "count": len(body["ids"]), "namespace": ns},
+            )
+        if path.startswith("/api/dashboard/analytics/"):
+            name = path.rsplit("/", 1)[1]
+            row = {"endpoints": {"endpoint": "/vectors/search"}}.get(name, {"date": "2026-01-01"})
+            return httpx.Response(200, json={name: [row]})
+        if path == "/vectors/namespaces":
+            return httpx.Response(200, json={"namespaces": ["default", "prod"]})
+        if path.startswith("/vectors/namespaces/") and path.endswith("/count"):
+            return httpx.Response(200, json={"count": 3})
+        return httpx.Response(404, json={"error": "Not found"})
+
+    return handler
+
+
+def mock_db(requests, **kwargs):
+    db = EmergentDB("emdb_test", **kwargs)
+    db._client.close()
+    db._client = httpx.Client(base_url=db._base_url, transport=httpx.MockTransport(fake_api(requests)))
+    return db
+
+
+def mock_async_db(requests):
+    db = AsyncEmergentDB("emdb_test")
+    db._client = httpx.AsyncClient(
+        base_url=db._base_url, transport=httpx.MockTransport(fake_api(requests))
+    )
+    return db
+
+
+def flaky_db(responses, **kwargs):
+    """Client whose transport replays ``responses`` (Response or exception) in order."""
+    requests = []
+    handler = fake_api(requests)
+
+    def flaky(request):
+        if responses:
+            outcome = responses.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return handler(request)
+
+    db = EmergentDB("emdb_test", **kwargs)
+    db._client.close()
+    db._client = httpx.Client(base_url=db._base_url, transport=httpx.MockTransport(flaky))
+    return db, requests
+
+
+# Retry backoff without the wait
+emergentdb.client._RETRY_BASE_DELAY = 0.0
+
+
+# ── 1. Insert sends id/vector/namespace ──
+def test_insert():
+    requests = []
+    with mock_db(requests) as db:
+        result = db.insert(7, [0.1, 0.2], metadata={"t": 1}, namespace="prod")
+    assert isinstance(result, InsertResult)
+    assert result.namespace == "prod"
+    assert requests == [
+        ("POST", "/vectors/insert", {"id": 7, "vector": [0.1, 0.2], "metadata": {"t": 1}, "namespace": "prod"})
+    ]
+
+
+test("insert() sends expected body and parses InsertResult", test_insert)
+
+
+# ── 2. Errors raise EmergentDBError ──
+def test_error():
+    requests = []
+    with mock_db(requests) as db:
+        try:
+            db._request("GET", "/nope")
+        except EmergentDBError as e:
+            assert e.status_code == 404
+            assert e.body == {"error": "Not found"}
+        else:
+            raise AssertionError("Expected EmergentDBError")
+
+
+test("HTTP errors raise EmergentDBError", test_error)
+
+
+# ── 3. Async client mirrors the sync API ──
+def test_async_roundtrip():
+    async def run():
+        requests = []
+        async with mock_async_db(requests) as db:
+            ins = await db.insert(1, [0.1], namespace="prod")
+            res = await db.search([0.1], k=1, namespace="prod")
+            dele = await db.delete(1, namespace="prod")
+            namespaces = await db.list_namespaces()
+        assert ins.success and ins.namespace == "prod"
+        assert res.count == 1 and res.results[0].id == 1
+        assert dele.deleted
+        assert namespaces == ["default", "prod"]
+
+    asyncio.run(run())
+
+
+test("AsyncEmergentDB insert/search/delete/list_namespaces", test_async_roundtrip)
+
+
+# ── 4. insert_many runs concurrently and preserves order ──
+def test_insert_many():
+    async def run():
+        requests = []
+        vectors = [{"id": i, "vector": [0.1]} for i in range(1, 51)]
+        async with mock_async_db(requests) as db:
+            results = await db.insert_many(vectors, namespace="bulk", concurrency=8)
+        assert [r.id for r in results] == list(range(1, 51))
+        assert all(r.namespace == "bulk" for r in results)
+        assert len(requests) == 50
+
+    asyncio.run(run())
+
+
+test("AsyncEmergentDB.insert_many() preserves order", test_insert_many)
+
+
+# ── 5. batch_delete sends all ids in one request ──
+def test_batch_delete():
+    requests = []
+    with mock_db(requests) as db:
+        result = db.batch_delete([1, 2, 3], namespace="prod")
+    assert result.ids == [1, 2, 3] and result.count == 3
+    assert requests == [("POST", "/vectors/batch_delete", {"ids": [1, 2, 3], "namespace": "prod"})]
+
+
+test("batch_delete() sends one request for all ids", test_batch_delete)
+
+
+# ── 6. binary=True sends packed float32 vectors ──
+def test_binary_vectors():
+    requests = []
+    with mock_db(requests, binary=True) as db:
+        db.search([0.5, -1.0], k=3)
+    _, _, body = requests[0]
+    assert "vector" not in body
+    assert body["dtype"] == "f32"
+    assert struct.unpack("<2f", base64.b64decode(body["vector_b64"])) == (0.5, -1.0)
+
+
+test("binary=True sends vector_b64 float32 payload", test_binary_vectors)
+
+
+# ── 7. Embedding cache only calls the model for unseen texts ──
+def test_embed_cache():
+    calls = []
+    db = EmergentDB("emdb_test")
+
+    @db.cache_embeddings(model="m", maxsize=2)
+    def embed(texts):
+        calls.append(texts)
+        if isinstance(texts, str):
+            return [float(len(texts))]
+        return [[float(len(t))] for t in texts]
+
+    assert embed("ab") == [2.0]
+    assert embed("ab") == [2.0]
+    assert embed(["ab", "abc", "ab"]) == [[2.0], [3.0], [2.0]]
+    assert calls == ["ab", ["abc"]]
+    assert isinstance(embed.cache, EmbedCache) and len(embed.cache) == 2
+
+    # Extra arguments are part of the key
+    @db.cache_embeddings(model="m")
+    def embed_dims(texts, dimensions=1536):
+        calls.append((texts, dimensions))
+        return [0.0] * dimensions
+
+    assert len(embed_dims("hi", dimensions=256)) == 256
+    assert len(embed_dims("hi", dimensions=1536)) == 1536
+    assert len(embed_dims("hi", dimensions=256)) == 256
+    assert len(embed_dims(["hi"], dimensions=1536)[0]) == 1536
+    assert calls[2:] == [("hi", 256), ("hi", 1536)]
+    db.close()
+
+
+test("cache_embeddings() skips the model for cached texts", test_embed_cache)
+
+
+# ── 8. search(cache=True) serves repeats locally until a write ──
+def test_search_cache():
+    requests = []
+    with mock_db(requests) as db:
+        a = db.search([0.1, 0.2], k=5, namespace="prod", cache=True)
+        b = db.search([0.1, 0.2], k=5, namespace="prod", cache=True)
+        db.search([0.1, 0.2], k=6, namespace="prod", cache=True)
+        assert len(requests) == 2
+
+        # Each call gets its own copy; mutating one leaves the cache intact
+        assert a is not b and a.results[0].id == b.results[0].id
+        a.results.clear()
+        b.results[0].metadata = {"edited": True}
+        c = db.search([0.1, 0.2], k=5, namespace="prod", cache=True)
+        assert len(c.results) == 1 and c.results[0].metadata is None
+        assert len(requests) == 2
+
+        db.insert(9, [0.3, 0.4], namespace="prod")
+        db.search([0.1, 0.2], k=5, namespace="prod", cache=True)
+        assert len(requests) == 4
+
+        # A quantized query is a different query
+        db.search([0.1, 0.2], k=5, namespace="prod", cache=True, dtype="int8")
+        assert len(requests) == 5
+
+        try:
+            db.search([0.1, 0.2], k=5, namespace="prod", cache=-1)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Expected ValueError for cache=-1")
+
+
+test("search(cache=True) caches repeats and invalidates on write", test_search_cache)
+
+
+# ── 9. analytics_all() fetches every breakdown ──
+def test_analytics_all():
+    requests = []
+    with mock_db(requests) as db:
+        stats = db.analytics_all()
+    assert sorted(stats) == ["endpoints", "errors", "growth", "keys", "latency", "namespaces"]
+    assert stats["endpoints"][0].endpoint == "/vectors/search"
+    assert stats["latency"][0].date == "2026-01-01"
+    assert len(requests) == 6
+
+    async def run():
+        async with mock_async_db([]) as adb:
+            return await adb.analytics_all()
+
+    assert sorted(asyncio.run(run())) == sorted(stats)
+
+    with mock_db([]) as db:
+        assert db.analytics_endpoints(raw=True) == [{"endpoint": "/vectors/search"}]
+        assert db.analytics_all(raw=True)["growth"] == [{"date": "2026-01-01"}]
+
+
+test("analytics_all() returns all six breakdowns", test_analytics_all)
+
+
+# ── 10. numpy arrays are accepted without .tolist() ──
+def test_numpy_vectors():
+    try:
+        import numpy as np
+    except ImportError:
+        return  # numpy is optional
+
+    requests = []
+    with mock_db(requests) as db:
+        db.insert(1, np.array([0.5, 0.25], dtype=np.float32))
+        arr = np.arange(6, dtype=np.float64).reshape(3, 2)
+        result = db.batch_insert_array([1, 2, 3], arr, metadata=[{"i": 0}, None, {"i": 2}], namespace="np")
+    assert requests[0][2]["vector"] == [0.5, 0.25]
+    rows = requests[1][2]["vectors"]
+    assert [r["vector"] for r in rows] == [[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]]
+    assert "metadata" not in rows[1] and rows[2]["metadata"] == {"i": 2}
+    assert result["ids"] == [1, 2, 3]
+
+    # A 1-D array the length of ids is not N vectors
+    try:
+        db.batch_insert_array([1, 2, 3], np.arange(3.0))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError for a 1-D array")
+
+
+test("insert()/batch_insert_array() accept numpy arrays", test_numpy_vectors)
+
+
+# ── 11. batch_insert streams a body the API can parse ──
+def test_batch_insert_streamed():
+    vectors = [{"id": i, "vector": [0.1, 0.2], "metadata": {"i": i}} for i in range(1, 4)]
+    requests = []
+    with mock_db(requests) as db:
+        result = db.batch_insert(vectors, namespace="stream")
+    assert requests[0][2] == {"vectors": vectors, "namespace": "stream"}
+    assert result.ids == [1, 2, 3]
+
+    async def run():
+        async_requests = []
+        async with mock_async_db(async_requests) as adb:
+            await adb.batch_insert(vectors, namespace="stream")
+        return async_requests
+
+    assert asyncio.run(run())[0][2] == {"vectors": vectors, "namespace": "stream"}
+
+
+test("batch_insert() streams a valid JSON body (sync + async)", test_batch_insert_streamed)
+
+
+# ── 12. 429/5xx and transport errors are retried ──
+def test_retries():
+    responses = [
+        httpx.Response(503, text="<html>unavailable</html>"),
+        httpx.ConnectError("connection reset"),
+        httpx.Response(429, headers={"Retry-After": "0"}, json={"error": "slow down"}),
+    ]
+    db, requests = flaky_db(responses)
+    with db:
+        result = db.insert(1, [0.1])
+    assert result.success and len(requests) == 1 and not responses
+
+    db, _ = flaky_db([httpx.Response(503, text="<html>unavailable</html>")], max_retries=0)
+    with db:
+        try:
+            db.insert(1, [0.1])
+        except EmergentDBError as e:
+            assert e.status_code == 503
+        else:
+            raise AssertionError("Expected EmergentDBError")
+
+
+test("Retries 429/5xx/transport errors, then raises EmergentDBError", test_retries)
+
+
+# ── 13. batch_insert_all reports where a failed job can resume ──
+def test_batch_insert_all_resume():
+    vectors = [{"id": i, "vector": [0.1]} for i in range(1, 2501)]
+    db, _ = flaky_db([], max_retries=0)
+    original = db._client._transport.handler
+    failures = [httpx.Response(400, json={"error": "bad vector"})]
+
+    def fail_second_chunk(request):
+        if json.loads(request.content)["vectors"][0]["id"] == 1001 and failures:
+            return failures.pop()
+        return original(request)
+
+    db._client._transport.handler = fail_second_chunk
+    with db:
+        try:
+            db.batch_insert_all(vectors)
+        except BatchInsertError as e:
+            assert e.offset == 1000
+            assert e.completed["count"] == 1000
+            assert e.status_code == 400
+            resumed = db.batch_insert_all(vectors[e.offset :])
+        else:
+            raise AssertionError("Expected BatchInsertError")
+    assert resumed["ids"] == list(range(1001, 2501))
+
+
+test("batch_insert_all() failure carries completed ids and resume offset", test_batch_insert_all_resume)
+
+
+# ── 13a. Sync batch_insert_all stops on any failure ──
+def test_batch_insert_all_stops():
+    requests = []
+    vectors = [{"id": i, "vector": [0.1]} for i in range(10_000)]
+    vectors[0]["metadata"] = {"x": object()}  # not JSON-serializable
+    with mock_db(requests, max_retries=0) as db:
+        try:
+            db.batch_insert_all(vectors, max_in_flight=1)
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("Expected TypeError for unserializable metadata")
+        try:
+            db.batch_insert_all(vectors, max_in_flight=0)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Expected ValueError for max_in_flight=0")
+    assert len(requests) <= 1, f"{len(requests)} chunks sent after the first one failed"
+
+
+test("batch_insert_all() cancels queued chunks on any failure", test_batch_insert_all_stops)
+
+
+# ── 13b. Async batch_insert_all stops sending chunks after a failure ──
+def test_async_batch_insert_all_stops():
+    requests = []
+    api = fake_api(requests)
+
+    async def fail_first_chunk(request):
+        await asyncio.sleep(0.01)  # a real request suspends; let the loop interleave
+        if json.loads(await request.aread())["vectors"][0]["id"] == 0:
+            return httpx.Response(400, json={"error": "bad vector"})
+        return api(request)
+
+    db = AsyncEmergentDB("emdb_test", max_retries=0)
+    db._client = httpx.AsyncClient(base_url=db._base_url, transport=httpx.MockTransport(fail_first_chunk))
+    vectors = [{"id": i, "vector": [0.1]} for i in range(10_000)]
+
+    async def run():
+        try:
+            await db.batch_insert_all(vectors, max_in_flight=1)
+        except BatchInsertError as e:
+            assert e.offset == 0 and e.completed["count"] == 0
+        else:
+            raise AssertionError("Expected BatchInsertError")
+        for bad in (
+            db.batch_insert_all(vectors, max_in_flight=0),
+            db.insert_many(vectors, concurrency=0),
+            db.batch_insert_stream(vectors, max_in_flight=0).__anext__(),
+        ):
+            try:
+                await bad
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("Expected ValueError for zero concurrency")
+        await db.aclose()
+
+    asyncio.run(run())
+    assert len(requests) <= 1, f"{len(requests)} chunks sent after the first one failed"
+
+
+test("Async batch_insert_all() cancels remaining chunks on failure", test_async_batch_insert_all_stops)
+
+
+# ── 14. Concurrent batch_insert_all keeps ids in input order ──
+def test_batch_insert_all_concurrent():
+    vectors = [{"id": i, "vector": [0.1]} for i in range(1, 4501)]
+    requests = []
+    with mock_db(requests) as db:
+        result = db.batch_insert_all(vectors, namespace="bulk", max_in_flight=4)
+    assert result["ids"] == list(range(1, 4501))
+    assert result["count"] == result["new_count"] == 4500
+    assert len(requests) == 5
+
+    async def run():
+        async with mock_async_db([]) as adb:
+            return await adb.batch_insert_all(vectors, namespace="bulk", max_in_flight=2)
+
+    assert asyncio.run(run())["ids"] == list(range(1, 4501))
+
+
+test("batch_insert_all(max_in_flight=...) preserves id order", test_batch_insert_all_concurrent)
+
+
+# ── 15. buffered() coalesces inserts into batch requests ──
+def test_buffered_writer():
+    requests = []
+    with mock_db(requests) as db:
+        with db.buffered(max_batch=10, max_delay_ms=50, namespace="buf") as w:
+            futures = [w.insert(i, [0.1], metadata={"i": i}) for i in range(1, 26)]
+        results = [f.result(timeout=5) for f in futures]
+    assert [[v["id"] for v in req[2]["vectors"]] for req in requests] == [
+        list(range(1, 11)),
+        list(range(11, 21)),
+        list(range(21, 26)),
+    ]
+    assert all(req[2]["namespace"] == "buf" for req in requests)
+    assert results[0].ids == list(range(1, 11)) and results[24].ids == list(range(21, 26))
+
+
+test("buffered() flushes by size and drains on exit", test_buffered_writer)
+
+
+# ── 16. dtype="int8" sends quantized vectors ──
+def test_int8_vectors():
+    data, scale = quantize_int8([0.5, -1.0, 0.25])
+    assert struct.unpack("<3b", data) == (64, -127, 32)
+    assert abs(scale - 1.0 / 127) < 1e-9
+
+    requests = []
+    with mock_db(requests) as db:
+        db.insert(1, [0.5, -1.0, 0.25], dtype="int8")
+        db.batch_insert([{"id": 2, "vector": [0.5, -1.0, 0.25]}], dtype="int8")
+    body = requests[0][2]
+    assert "vector" not in body and body["dtype"] == "int8"
+    assert base64.b64decode(body["vector_q8_b64"]) == data and body["scale"] == scale
+    assert requests[1][2]["vectors"][0]["vector_q8_b64"] == body["vector_q8_b64"]
+
+
+test("dtype=\"int8\" sends vector_q8_b64 + scale", test_int8_vectors)
+
+
+# ── 17. default_client() is a shared, env-configured client ──
+def test_default_client():
+    os.environ["EMERGENTDB_API_KEY"] = "emdb_env_key"
+    emergentdb.client._default_client = None
+    try:
+        db = emergentdb.default_client()
+        assert db is emergentdb.default_client()
+        assert db._client.headers["authorization"] == "Bearer emdb_env_key"
+        assert db._client.headers["user-agent"] == f"emergentdb-python/{emergentdb.__version__}"
+        db.close()
+    finally:
+        emergentdb.client._default_client = None
+        del os.environ["EMERGENTDB_API_KEY"]
+
+
+test("default_client() reads EMERGENTDB_API_KEY and is reused", test_default_client)
+
+
+# ── 18. limits= sizes the connection pool ──
+def client_kwargs(cls, **kwargs):
+    """Keyword arguments ``cls`` passes when it builds its httpx client."""
+    name = "AsyncClient" if cls is AsyncEmergentDB else "Client"
+    real = getattr(httpx, name)
+    seen = {}
+
+    def record(**kw):
+        seen.update(kw)
+        return real(**kw)
+
+    setattr(httpx, name, record)
+    try:
+        db = cls("emdb_test", **kwargs)
+    finally:
+        setattr(httpx, name, real)
+    if cls is AsyncEmergentDB:
+        asyncio.run(db.aclose())
+    else:
+        db.close()
+    return seen
+
+
+def test_limits():
+    kw = client_kwargs(EmergentDB)
+    assert kw["http2"] is True and kw["limits"].max_connections == 64
+
+    limits = httpx.Limits(max_connections=8, max_keepalive_connections=4)
+    assert client_kwargs(AsyncEmergentDB, limits=limits)["limits"] is limits
+
+    # An explicit transport= would make httpx ignore HTTP(S)_PROXY / NO_PROXY
+    for cls in (EmergentDB, AsyncEmergentDB):
+        assert "transport" not in client_kwargs(cls), f"{cls.__name__} passes transport="
+
+
+test("limits= overrides the default pool; env proxies stay honoured", test_limits)
+
+
+# ── 19. dtype="f16" sends packed half-precision vectors ──
+def test_f16_vectors():
+    import numpy as np
+
+    requests = []
+    with mock_db(requests) as db:
+        db.insert(1, [0.5, -1.0, 0.25], dtype="f16")
+        db.insert(2, np.array([0.5, -1.0, 0.25]), dtype="f16")
+    body = requests[0][2]
+    assert "vector" not in body and body["dtype"] == "f16"
+    assert struct.unpack("<3e", base64.b64decode(body["vector_b16"])) == (0.5, -1.0, 0.25)
+    assert requests[1][2]["vector_b16"] == body["vector_b16"]
+
+    # Out-of-range values raise the same way for lists and arrays
+    for vector in ([1e6, 0.0], np.array([1e6, 0.0])):
+        try:
+            db.insert(3, vector, dtype="f16")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"Expected ValueError for {type(vector).__name__}")
+
+
+test("dtype=\"f16\" sends vector_b16 float16 payload", test_f16_vectors)
+
+
+# ── 20. count() reads the namespace size without a search ──
+def test_count():
+    requests = []
+    with mock_db(requests) as db:
+        assert db.count() == 3
+        assert db.count("my ns") == 3
+    db = mock_async_db(requests)
+    assert asyncio.run(db.count("prod")) == 3
+    assert [path for _, path, _ in requests] == [
+        "/vectors/namespaces/default/count",
+        "/vectors/namespaces/my ns/count",
+        "/vectors/namespaces/prod/count",
+    ]
+
+
+test("count() GETs /vectors/namespaces/{ns}/count", test_count)
+
+
+# ── 21. batch_insert_stream yields each batch as it completes ──
+def test_batch_insert_stream():
+    requests = []
+    db = mock_async_db(requests)
+    vectors = [{"id": i, "vector": [0.1, 0.2]} for i in range(250)]
+
+    async def consume():
+        return [result async for result in db.batch_insert_stream(vectors, batch_size=100)]
+
+    results = asyncio.run(consume())
+    assert len(requests) == 3
+    assert sorted(len(r.ids) for r in results) == [50, 100, 100]
+    assert sorted(i for r in results for i in r.ids) == list(range(250))
+
+
+test("AsyncEmergentDB.batch_insert_stream() yields per-batch results", test_batch_insert_stream)
+
+
+# ── 22. compress="gzip" sends gzip-encoded bodies ──
+def test_gzip_compression():
+    seen = []
+    api = fake_api([])
+
+    def handler(request):
+        seen.append((request.headers.get("content-encoding"), request.content))
+        body = gzip.decompress(request.content) if request.content else b""
+        return api(httpx.Request(request.method, request.url, content=body))
+
+    db = EmergentDB("emdb_test", compress="gzip")
+    db._client.close()
+    db._client = httpx.Client(base_url=db._base_url, transport=httpx.MockTransport(handler))
+    with db:
+        db.insert(1, [0.5] * 8)
+        db.batch_insert([{"id": 2, "vector": [0.5] * 8}])  # streamed body
+        db.list_namespaces()
+
+    for encoding, content in seen[:2]:
+        assert encoding == "gzip"
+        assert json.loads(gzip.decompress(content))
+    assert seen[2] == (None, b"")
+
+    try:
+        EmergentDB("emdb_test", compress="brotli")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError for an unknown encoding")
+
+
+test("compress=\"gzip\" gzips request bodies (incl. streamed)", test_gzip_compression)
+
+
+# ── 23. Non-str metadata keys encode the same with or without orjson ──
+def test_non_str_metadata_keys():
+    import emergentdb._codec as codec
+
+    metadata = {1: "a", 2.5: "b", None: "c", "k": "d"}
+    expected = {"1": "a", "2.5": "b", "null": "c", "k": "d"}
+    for backend in (codec.orjson, None):
+        saved, codec.orjson = codec.orjson, backend
+        try:
+            requests = []
+            with mock_db(requests) as db:
+                db.insert(1, [0.1], metadata=metadata)
+            assert requests[0][2]["metadata"] == expected, (backend, requests[0][2]["metadata"])
+        finally:
+            codec.orjson = saved
+
+
+test("Non-str metadata keys are stringified like stdlib json", test_non_str_metadata_keys)
+
+
+# ── 24. max_retries is the only retry budget and must be >= 0 ──
+def test_max_retries_bounds():
+    for cls in (EmergentDB, AsyncEmergentDB):
+        try:
+            cls("emdb_test", max_retries=-1)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{cls.__name__} accepted max_retries=-1")
+
+    # No transport of our own, so no transport-level retries on top of max_retries
+    for cls in (EmergentDB, AsyncEmergentDB):
+        assert "transport" not in client_kwargs(cls, max_retries=0)
+
+
+test("max_retries rejects negatives; transport adds no hidden retries", test_max_retries_bounds)
+
+
+# ── Summary ──
+def main():
+    # Collect the report and write it in one go rather than a print per test
+    lines = ["\n=== Client Tests (mock transport) ===\n\n"]
+    failed = 0
+    for name, fn in TESTS:
+        try:
+            fn()
+            lines.append(f"  PASS  {name}\n")
+        except Exception as e:
+            failed += 1
+            lines.append(f"  FAIL  {name}: {e}\n")
+    lines.append(f"\n  Results: {len(TESTS) - failed} passed, {failed} failed\n\n")
+    sys.stdout.writelines(lines)
+    return failed
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
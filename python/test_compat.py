@@ -25,22 +25,13 @@ from emergentdb import (
 )
 
 
-passed = 0
-failed = 0
+# (name, fn) in run order. pytest collects the test_* functions directly;
+# `python <this file>` runs them through main() below.
+TESTS = []
 
 
 def test(name, fn):
-    global passed, failed
-    try:
-        fn()
-        passed += 1
-        print(f"  PASS  {name}")
-    except Exception as e:
-        failed += 1
-        print(f"  FAIL  {name}: {e}")
-
-
-print("\n=== dhi <> Pydantic Compatibility Tests (Python SDK) ===\n")
+    TESTS.append((name, fn))
 
 
 # ── 1. model_validate() on valid data ──
@@ -248,6 +239,21 @@ test("Models work as type hints", test_type_hint)
 
 
 # ── Summary ──
-print(f"\n  Results: {passed} passed, {failed} failed\n")
-if failed > 0:
-    sys.exit(1)
+def main():
+    # Collect the report and write it in one go rather than a print per test
+    lines = ["\n=== dhi <> Pydantic Compatibility Tests (Python SDK) ===\n\n"]
+    failed = 0
+    for name, fn in TESTS:
+        try:
+            fn()
+            lines.append(f"  PASS  {name}\n")
+        except Exception as e:
+            failed += 1
+            lines.append(f"  FAIL  {name}: {e}\n")
+    lines.append(f"\n  Results: {len(TESTS) - failed} passed, {failed} failed\n\n")
+    sys.stdout.writelines(lines)
+    return failed
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
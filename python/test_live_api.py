@@ -1,11 +1,17 @@
 """
 Live API test using the EmergentDB Python SDK.
-Tests insert, search, namespaces, delete against the production API.
+Tests the sync EmergentDB client against the production API: insert,
+search, namespaces, delete, batch insert and analytics.
+(test_sdk.py covers the async client.)
 Bolt is configured for 1536-dim vectors.
 """
+import hashlib
+import logging
 import os
-import random
 import sys
+
+import numpy as np
+
 sys.path.insert(0, ".")
 from emergentdb import EmergentDB
 
@@ -15,11 +21,26 @@ if not API_KEY:
     sys.exit(1)
 DIM = 1536  # Bolt is configured for 1536-dim (OpenAI ada-002)
 
-def rand_vec(seed=None):
-    """Generate a random 1536-dim vector."""
-    if seed is not None:
-        random.seed(seed)
-    return [random.uniform(-0.1, 0.1) for _ in range(DIM)]
+def rng(name):
+    """Independent generator seeded from a hash of ``name`` (no global RNG state)."""
+    return np.random.default_rng(int.from_bytes(hashlib.md5(name.encode()).digest()[:8], "big"))
+
+# Vectors the tests reuse, generated once up front
+_VECS = {
+    name: rng(name).uniform(-0.1, 0.1, DIM)
+    for name in ("default-doc", "ns-doc-1", "ns-doc-2", "ns-doc-1-updated", "batch")
+}
+
+def rand_vec(name):
+    """Reproducible 1536-dim vector for ``name``."""
+    if name in _VECS:
+        return _VECS[name]
+    return rng(name).uniform(-0.1, 0.1, DIM)
+
+# Failures are always reported; set EMERGENTDB_TEST_VERBOSE=1 to also see each pass
+logging.basicConfig(stream=sys.stdout, format="%(message)s")
+log = logging.getLogger("emergentdb.tests")
+log.setLevel(logging.INFO if os.environ.get("EMERGENTDB_TEST_VERBOSE") == "1" else logging.WARNING)
 
 passed = 0
 failed = 0
@@ -29,20 +50,20 @@ def test(name, fn):
     try:
         result = fn()
         passed += 1
-        print(f"  PASS  {name}")
+        log.info("  PASS  %s", name)
         if result:
-            print(f"        -> {result}")
+            log.info("        -> %s", result)
     except Exception as e:
         failed += 1
-        print(f"  FAIL  {name}: {e}")
+        log.warning("  FAIL  %s: %s", name, e)
 
 db = EmergentDB(API_KEY)
 
-print("\n=== Live API Test with Python SDK (1536-dim) ===\n")
+log.info("\n=== Live API Test with Python SDK (1536-dim) ===\n")
 
 # ── 1. Insert into default namespace ──
 def test_insert_default():
-    result = db.insert(100, rand_vec(seed=42), metadata={"title": "SDK test doc"})
+    result = db.insert(100, rand_vec("default-doc"), metadata={"title": "SDK test doc"})
     assert result.success, f"Insert failed: {result}"
     assert result.id == 100
     assert result.namespace == "default"
@@ -51,7 +72,7 @@ test("Insert vector into default namespace", test_insert_default)
 
 # ── 2. Insert into "sdk-test" namespace ──
 def test_insert_ns():
-    result = db.insert(1, rand_vec(seed=1), metadata={"title": "Namespace doc 1"}, namespace="sdk-test")
+    result = db.insert(1, rand_vec("ns-doc-1"), metadata={"title": "Namespace doc 1"}, namespace="sdk-test")
     assert result.success
     assert result.namespace == "sdk-test"
     return f"id={result.id}, ns={result.namespace}"
@@ -59,14 +80,14 @@ test("Insert vector into sdk-test namespace", test_insert_ns)
 
 # ── 3. Insert another into "sdk-test" ──
 def test_insert_ns2():
-    result = db.insert(2, rand_vec(seed=2), metadata={"title": "Namespace doc 2"}, namespace="sdk-test")
+    result = db.insert(2, rand_vec("ns-doc-2"), metadata={"title": "Namespace doc 2"}, namespace="sdk-test")
     assert result.success
     return f"id={result.id}, ns={result.namespace}"
 test("Insert second vector into sdk-test namespace", test_insert_ns2)
 
 # ── 4. Search in "sdk-test" ──
 def test_search_ns():
-    result = db.search(rand_vec(seed=1), k=5, include_metadata=True, namespace="sdk-test")
+    result = db.search(rand_vec("ns-doc-1"), k=5, include_metadata=True, namespace="sdk-test")
     assert result.namespace == "sdk-test"
     assert result.count > 0, "Expected results in sdk-test namespace"
     return f"{result.count} results: {[{'id': r.id, 'score': round(r.score, 4), 'meta': r.metadata} for r in result.results]}"
@@ -74,10 +95,10 @@ test("Search in sdk-test namespace", test_search_ns)
 
 # ── 5. Search in default namespace — IDOR check ──
 def test_search_default():
-    result = db.search(rand_vec(seed=1), k=5, include_metadata=True)
+    result = db.search(rand_vec("ns-doc-1"), k=5)
     ids = [r.id for r in result.results]
-    assert 1 not in ids, f"IDOR: sdk-test vector 1 leaked into default namespace! ids={ids}"
-    assert 2 not in ids, f"IDOR: sdk-test vector 2 leaked into default namespace! ids={ids}"
+    leaked = {1, 2}.intersection(ids)
+    assert not leaked, f"IDOR: sdk-test vectors {sorted(leaked)} leaked into default namespace! ids={ids}"
     return f"{result.count} results, ids={ids}"
 test("Search in default namespace (IDOR check)", test_search_default)
 
@@ -90,7 +111,7 @@ test("List namespaces", test_list_ns)
 
 # ── 7. Upsert — re-insert same ID with new metadata ──
 def test_upsert():
-    result = db.insert(1, rand_vec(seed=10), metadata={"title": "Updated doc 1"}, namespace="sdk-test")
+    result = db.insert(1, rand_vec("ns-doc-1-updated"), metadata={"title": "Updated doc 1"}, namespace="sdk-test")
     assert result.success
     assert result.upserted, f"Expected upserted=True, got {result.upserted}"
     return f"upserted={result.upserted}"
@@ -114,11 +135,59 @@ test("Delete vector from default namespace", test_delete_default)
 
 # ── 10. Verify deletion ──
 def test_verify_deleted():
-    result = db.search(rand_vec(seed=1), k=5, namespace="sdk-test")
+    result = db.search(rand_vec("ns-doc-1"), k=1, namespace="sdk-test")
     assert result.count == 0, f"Expected 0 results after delete, got {result.count}"
     return "0 results (correct)"
 test("Verify sdk-test namespace is empty after delete", test_verify_deleted)
 
+# ── 11. Batch insert ──
+def test_batch_insert():
+    # Row 0 is rand_vec("batch"), which the batch search queries
+    arr = rng("batch").uniform(-0.1, 0.1, (3, DIM)).astype(np.float32)
+    vectors = [{"id": i + 1, "vector": arr[i], "metadata": {"batch": True}} for i in range(3)]
+    result = db.batch_insert(vectors, namespace="sdk-batch-test")
+    assert result.success and result.count == 3, f"Batch insert failed: {result}"
+    return f"ids={result.ids}, new={result.new_count}, upserted={result.upserted_count}"
+test("Batch insert 3 vectors into sdk-batch-test namespace", test_batch_insert)
+
+# ── 12. Search batch namespace ──
+def test_search_batch():
+    result = db.search(rand_vec("batch"), k=3, namespace="sdk-batch-test")
+    assert result.count > 0, "Expected results in sdk-batch-test namespace"
+    return f"{result.count} results"
+test("Search in sdk-batch-test namespace", test_search_batch)
+
+# ── 13. Clean up batch namespace ──
+# Per-id delete: POST /vectors/batch_delete is not served in production yet
+def test_delete_batch():
+    for i in (1, 2, 3):
+        result = db.delete(i, namespace="sdk-batch-test")
+        assert result.deleted, f"Delete {i} failed: {result}"
+    return "deleted ids 1, 2, 3 from sdk-batch-test"
+test("Delete batch vectors from sdk-batch-test namespace", test_delete_batch)
+
+# ── 14. Verify batch deletion ──
+def test_verify_batch_deleted():
+    result = db.search(rand_vec("batch"), k=1, namespace="sdk-batch-test")
+    assert result.count == 0, f"Expected 0 results after delete, got {result.count}"
+    return "0 results (correct)"
+test("Verify sdk-batch-test namespace is empty after delete", test_verify_batch_deleted)
+
+# ── 15. Analytics ──
+def test_analytics():
+    for method in (
+        db.analytics_endpoints,
+        db.analytics_namespaces,
+        db.analytics_latency,
+        db.analytics_errors,
+        db.analytics_keys,
+        db.analytics_growth,
+    ):
+        stats = method()
+        assert isinstance(stats, list), f"{method.__name__}: expected a list, got {type(stats).__name__}"
+    return "all six analytics endpoints returned lists"
+test("Analytics: endpoints, namespaces, latency, errors, keys, growth", test_analytics)
+
 db.close()
 
 print(f"\n  Results: {passed} passed, {failed} failed\n")
@@ -24,51 +24,44 @@ from emergentdb import (
 # Try importing from dhi (what our SDK uses)
 from dhi import BaseModel, Field
 
-passed = 0
-failed = 0
+# (name, fn) in run order. pytest collects the test_* functions directly;
+# `python <this file>` runs them through main() below.
+TESTS = []
 
 
 def test(name, fn):
-    global passed, failed
-    try:
-        fn()
-        passed += 1
-        print(f"  PASS  {name}")
-    except Exception as e:
-        failed += 1
-        print(f"  FAIL  {name}: {e}")
+    TESTS.append((name, fn))
 
 
 # ── Simulate API responses (what SDK methods return) ──
-mock_insert = InsertResult.model_validate(
-    {"success": True, "id": 42, "namespace": "production", "upserted": False}
+# Known-good fixtures, so build them with model_construct() and skip validation;
+# the tests that exercise validation call model_validate() themselves.
+mock_insert = InsertResult.model_construct(
+    success=True, id=42, namespace="production", upserted=False
 )
 
-mock_search = SearchResponse.model_validate(
-    {
-        "results": [
-            {"id": 1, "score": 0.95, "metadata": {"title": "Doc A", "category": "science"}},
-            {"id": 2, "score": 0.87, "metadata": {"title": "Doc B", "category": "math"}},
-            {"id": 3, "score": 0.72},
-        ],
-        "count": 3,
-        "namespace": "production",
-    }
+mock_search = SearchResponse.model_construct(
+    results=[
+        SearchResult.model_construct(id=1, score=0.95, metadata={"title": "Doc A", "category": "science"}),
+        SearchResult.model_construct(id=2, score=0.87, metadata={"title": "Doc B", "category": "math"}),
+        SearchResult.model_construct(id=3, score=0.72, metadata=None),
+    ],
+    count=3,
+    namespace="production",
 )
 
-mock_batch = BatchInsertResult.model_validate(
-    {
-        "success": True,
-        "ids": [1, 2, 3, 4, 5],
-        "count": 5,
-        "namespace": "default",
-        "new_count": 3,
-        "upserted_count": 2,
-    }
+mock_batch = BatchInsertResult.model_construct(
+    success=True,
+    ids=[1, 2, 3, 4, 5],
+    count=5,
+    namespace="default",
+    new_count=3,
+    upserted_count=2,
 )
 
-
-print("\n=== User Workflow Tests: dhi SDK outputs in Pydantic pipelines ===\n")
+# Serialized once and shared by the tests that only read them
+mock_insert_dump = mock_insert.model_dump()
+mock_insert_json = mock_insert.model_dump_json()
 
 
 # ── 1. User has their own Pydantic model and populates from SDK result ──
@@ -121,8 +114,7 @@ test("User validates SDK metadata with their own Pydantic model", test_validate_
 
 # ── 4. User converts SDK result to dict and spreads into new dict ──
 def test_dict_spread():
-    data = mock_insert.model_dump()
-    enriched = {**data, "source": "my-app", "inserted_at": 1234567890}
+    enriched = {**mock_insert_dump, "source": "my-app", "inserted_at": 1234567890}
     assert enriched["id"] == 42
     assert enriched["namespace"] == "production"
     assert enriched["source"] == "my-app"
@@ -172,8 +164,7 @@ test("User maps SDK search results into their own DB records", test_map_to_db_mo
 
 # ── 7. User serializes SDK result to JSON for logging ──
 def test_json_serialize():
-    json_str = mock_insert.model_dump_json()
-    parsed = json.loads(json_str)
+    parsed = json.loads(mock_insert_json)
     assert parsed["id"] == 42
     assert parsed["namespace"] == "production"
 
@@ -212,8 +203,8 @@ test("User uses batch insert IDs for downstream pipeline", test_batch_downstream
 def test_accumulate():
     all_results: List[InsertResult] = []
     for i in range(1, 4):
-        result = InsertResult.model_validate(
-            {"success": True, "id": i, "namespace": "batch-test"}
+        result = InsertResult.model_construct(
+            success=True, id=i, namespace="batch-test", upserted=False
         )
         all_results.append(result)
 
@@ -289,6 +280,21 @@ test("User converts SDK results to tabular dicts (for pandas/csv)", test_tabular
 
 
 # ── Summary ──
-print(f"\n  Results: {passed} passed, {failed} failed\n")
-if failed > 0:
-    sys.exit(1)
+def main():
+    # Collect the report and write it in one go rather than a print per test
+    lines = ["\n=== User Workflow Tests: dhi SDK outputs in Pydantic pipelines ===\n\n"]
+    failed = 0
+    for name, fn in TESTS:
+        try:
+            fn()
+            lines.append(f"  PASS  {name}\n")
+        except Exception as e:
+            failed += 1
+            lines.append(f"  FAIL  {name}: {e}\n")
+    lines.append(f"\n  Results: {len(TESTS) - failed} passed, {failed} failed\n\n")
+    sys.stdout.writelines(lines)
+    return failed
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)